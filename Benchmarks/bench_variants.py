@@ -0,0 +1,370 @@
+"""
+Benchmarks the interchangeable variants of every lab exercise.
+
+Each exercise module (Lab N/Solutions/ex_M_sol.py, or Lab N/ex_M_sol.py) is scanned for
+functions named fM_1, fM_2, ... and, when a workload is registered for the exercise,
+every variant is run on inputs of increasing size. For each variant the script reports
+the best wall time and the peak memory (measured with tracemalloc) at each size, and the
+scaling exponent, that is, the slope of log(time) against log(size). Exercises without a
+workload (those whose variants write files and directories of their own) are listed as such.
+
+Variants that do not take the same required parameters as fM_1 (batch or streaming
+helpers with a different interface) are left out, and a variant raising an exception
+at some size (typically RecursionError) is reported as failing from that size on.
+
+Results can be saved as a JSON baseline and later runs compared against it:
+
+    python Benchmarks/bench_variants.py --save baseline.json
+    python Benchmarks/bench_variants.py --compare baseline.json --tolerance 0.25
+"""
+import argparse
+import atexit
+import contextlib
+import importlib.util
+import inspect
+import json
+import math
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, NamedTuple
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+class Workload(NamedTuple):
+    """
+    How to exercise the variants of one exercise.
+
+    Attributes:
+        sizes: The input sizes to benchmark, in increasing order
+        make_args: Builds a fresh tuple of positional arguments for a given size
+        run: Calls a variant on the arguments; defaults to variant(*args)
+    """
+    sizes: tuple[int, ...]
+    make_args: Callable[[int, random.Random], tuple]
+    run: Callable[[Callable, tuple, int], Any] | None = None
+
+
+_files: dict[tuple[str, int], str] = {}
+
+
+def _text_file(kind: str, size: int, line: Callable[[int, random.Random], str]) -> str:
+    """
+    Returns the path of a temporary file of size lines, written once per kind and size.
+    """
+    if (kind, size) not in _files:
+        rng = random.Random(size)
+        fd, path = tempfile.mkstemp(prefix=f"{kind}_{size}_", suffix=".txt")
+        with os.fdopen(fd, "w") as file:
+            file.writelines(line(i, rng) + "\n" for i in range(size))
+        atexit.register(os.remove, path)
+        _files[kind, size] = path
+    return _files[kind, size]
+
+
+def _palindrome(size: int) -> list[int]:
+    half = list(range(size // 2))
+    return half + half[::-1]
+
+
+def _square(size: int, rng: random.Random) -> list[list[int]]:
+    return [[rng.randint(-9, 9) for _ in range(size)] for _ in range(size)]
+
+
+def _special_list(size: int, rng: random.Random) -> list:
+    """
+    Returns a list of size integers, arbitrarily nested in lists of up to 4 members.
+    """
+    members = list(range(size))
+    while len(members) > 4:
+        start = rng.randrange(len(members) - 1)
+        stop = start + rng.randint(2, 4)
+        members[start:stop] = [members[start:stop]]
+    return members
+
+
+def _primes(count: int) -> list[int]:
+    primes = []
+    candidate = 2
+    while len(primes) < count:
+        if all(candidate % p for p in primes if p * p <= candidate):
+            primes.append(candidate)
+        candidate += 1
+    return primes
+
+
+_CUSTOMERS_HEADER = "Index,Customer Id,First Name,Last Name,Company,City,Country,Phone 1,Phone 2,Email,Subscription Date,Website"
+_COUNTRIES = ("Australia", "Brazil", "Chile", "Denmark", "Egypt", "France", "Ghana", "Honduras")
+
+
+def _customer(i: int, rng: random.Random) -> str:
+    if not i:
+        return _CUSTOMERS_HEADER
+    return (f"{i},{rng.getrandbits(40):x},First{i},Last{i},Company{i},City{i},{rng.choice(_COUNTRIES)},"
+            f"555-{i:04d},555-{i:04d},c{i}@example.com,2021-01-01,https://example.com")
+
+
+def _modulo_sums(variant: Callable, args: tuple, size: int) -> Any:
+    Modulo = variant()[-1]
+    total, product = Modulo(0, 101), Modulo(1, 101)
+    for k in args[0]:
+        total += Modulo(k, 101)
+        product *= Modulo(k, 101)
+    return total, product
+
+
+def _validate_primes(variant: Callable, args: tuple, size: int) -> None:
+    _, Prime = variant()
+    Prime.reset()
+    for p in args[0]:
+        Prime(p)
+
+
+WORKLOADS: dict[str, Workload] = {
+    "Lab 1/ex_1": Workload((1_000, 10_000, 100_000), lambda n, rng: (n, 5)),
+    "Lab 1/ex_2": Workload((10, 100, 300), lambda n, rng: (n,)),
+    "Lab 1/ex_3": Workload((100, 1_000, 5_000), lambda n, rng: (list(range(n)),)),
+    "Lab 1/ex_4": Workload((100, 1_000, 10_000), lambda n, rng: ({i: i + 1 for i in range(n)}, 0)),
+    "Lab 1/ex_5": Workload((1_000, 10_000, 100_000), lambda n, rng: (
+        _text_file("names", n, lambda i, rng: f"Name{i},{rng.randint(1, 999)}"),)),
+    "Lab 1/ex_6": Workload((1_000, 10_000, 100_000), lambda n, rng: (
+        _text_file("symbols", n, lambda i, rng: f"{rng.randint(1, 20)} {rng.choice('#*+')}"),)),
+    "Lab 2/ex_3": Workload((1_000, 10_000, 100_000), lambda n, rng: (_palindrome(n),)),
+    "Lab 2/ex_4": Workload((100, 1_000, 10_000), lambda n, rng: (list(range(n)),)),
+    "Lab 2/ex_5": Workload((1_000, 10_000, 100_000), lambda n, rng: (
+        [rng.randint(-n, n) for _ in range(n)],)),
+    "Lab 2/ex_6": Workload((64, 1_024, 8_192), lambda n, rng: (3 << (n // 2),)),
+    "Lab 3/ex_1": Workload((100, 1_000, 10_000), lambda n, rng: (n, 5)),
+    "Lab 3/ex_2": Workload((100, 1_000, 4_000), lambda n, rng: (
+        int("".join(rng.choice("123456789") for _ in range(n))),)),
+    "Lab 3/ex_3": Workload((10, 100, 1_000), lambda n, rng: (
+        int("".join(rng.choice("12345") for _ in range(n))),)),
+    "Lab 3/ex_4": Workload((1_000, 10_000, 100_000), lambda n, rng: (n, 3)),
+    "Lab 3/ex_5": Workload((100, 1_000, 10_000), lambda n, rng: tuple(
+        (rng.randint(0, 999), rng.randint(1, 999_999)) for _ in range(n)),
+                           lambda variant, args, n: [variant(*pair) for pair in args]),
+    "Lab 3/ex_6": Workload((1_000, 10_000, 100_000), lambda n, rng: (
+        [[rng.randint(0, 9) for _ in range(4)] for _ in range(n)], [3, 1, 4, 2])),
+    "Lab 4/ex_1": Workload((100, 1_000, 10_000), lambda n, rng: (n,)),
+    "Lab 4/ex_2": Workload((10, 100, 1_000), lambda n, rng: (set(range(n)),)),
+    "Lab 4/ex_3": Workload((100, 1_000, 10_000), lambda n, rng: (
+        [rng.randint(0, 9) for _ in range(n)],)),
+    "Lab 4/ex_4": Workload((64, 256, 1_024), lambda n, rng: (rng.getrandbits(n) | 1 << n - 1,)),
+    "Lab 4/ex_5": Workload((1_000, 10_000, 100_000), lambda n, rng: tuple(range(n))),
+    "Lab 4/ex_6": Workload((1_000, 10_000, 100_000), lambda n, rng: tuple(range(n))),
+    "Lab 5/ex_1": Workload((1_000, 10_000, 100_000), lambda n, rng: (list(range(n)), 2)),
+    "Lab 5/ex_2": Workload((1_000, 10_000, 100_000), lambda n, rng: ([1, 2, 3], n)),
+    "Lab 5/ex_3": Workload((1_000, 10_000, 100_000), lambda n, rng: (
+        [[[rng.randint(-9, 9) for _ in range(3)] for _ in range(rng.randint(1, 4))] for _ in range(n)], 2)),
+    "Lab 5/ex_4": Workload((1_000, 10_000, 100_000), lambda n, rng: (
+        [rng.randint(0, 9) for _ in range(n)],)),
+    "Lab 5/ex_5": Workload((1_000, 10_000, 100_000), lambda n, rng: (_text_file("customers", n, _customer),)),
+    "Lab 6/ex_1": Workload((10, 100, 300), lambda n, rng: (
+        [[rng.randint(0, 99) for _ in range(n)] for _ in range(n)],)),
+    "Lab 6/ex_2": Workload((10, 100, 1_000), lambda n, rng: (_square(n, rng), rng.randint(1, n), rng.randint(1, n))),
+    "Lab 6/ex_3": Workload((10, 100, 300), lambda n, rng: (_square(n, rng),)),
+    "Lab 6/ex_4": Workload((10, 100, 300), lambda n, rng: (n,)),
+    "Lab 6/ex_5": Workload((10, 100, 300), lambda n, rng: (_square(n, rng),)),
+    "Lab 6/ex_6": Workload((10, 100, 300), lambda n, rng: (_square(n, rng),)),
+    "Lab 7/ex_1": Workload((100, 1_000, 10_000), lambda n, rng: (),
+                           lambda variant, args, n: list(islice(variant(*args), n))),
+    "Lab 7/ex_2": Workload((10, 100, 1_000), lambda n, rng: (),
+                           lambda variant, args, n: list(islice(variant(*args), n))),
+    "Lab 7/ex_3": Workload((100, 1_000, 10_000), lambda n, rng: ([n, 3],)),
+    "Lab 7/ex_4": Workload((1_000, 10_000, 100_000), lambda n, rng: (list(range(n)),)),
+    "Lab 7/ex_5": Workload((1_000, 10_000, 100_000), lambda n, rng: (_special_list(n, rng),)),
+    "Lab 7/ex_6": Workload((10, 100, 900), lambda n, rng: ([0, 1], [1, 1], n)),
+    "Lab 8/ex_1": Workload((100, 1_000, 10_000), lambda n, rng: (_primes(n),), _validate_primes),
+    "Lab 8/ex_2": Workload((100, 1_000, 10_000), lambda n, rng: ([rng.randint(-999, 999) for _ in range(n)],),
+                           lambda variant, args, n: list(map(variant()[-1], args[0], [101] * n))),
+    "Lab 8/ex_3": Workload((100, 1_000, 10_000), lambda n, rng: ([rng.randint(-999, 999) for _ in range(n)],),
+                           _modulo_sums),
+    "Lab 8/ex_4": Workload((10, 100, 300), lambda n, rng: (),
+                           lambda variant, args, n: list(islice(variant()(), n))),
+}
+
+
+def discover(root: Path = ROOT) -> dict[str, tuple[Path, list[str]]]:
+    """
+    Finds the exercise modules of every lab and the names of their fM_k variants.
+
+    The sources are scanned with a regular expression rather than imported, since some
+    modules are scripts that prompt for input when run.
+
+    Returns:
+        A dictionary mapping "Lab N/ex_M" to the module path and its variant names
+    """
+    exercises = {}
+    for path in sorted(root.glob("Lab */**/ex_*_sol.py")):
+        lab = path.relative_to(root).parts[0]
+        exercise = path.stem.removesuffix("_sol")
+        number = exercise.split("_")[1]
+        names = re.findall(rf"^def (f{number}_\d+)\(", path.read_text(encoding="utf-8"), re.M)
+        if names:
+            exercises[f"{lab}/{exercise}"] = path, sorted(names, key=lambda name: int(name.split("_")[1]))
+    return exercises
+
+
+def load_variants(path: Path, names: list[str]) -> dict[str, Callable]:
+    """
+    Imports the module at path and returns those of its variants that share the interface of the first one.
+    """
+    module_name = "_bench_" + re.sub(r"\W", "_", str(path.relative_to(ROOT)))
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    sys.path.insert(0, str(path.parent))
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        sys.path.remove(str(path.parent))
+    variants = {name: getattr(module, name) for name in names}
+    reference = _required_parameters(variants[names[0]])
+    return {name: variant for name, variant in variants.items() if _required_parameters(variant) == reference}
+
+
+def _required_parameters(function: Callable) -> list[str]:
+    return [parameter.name for parameter in inspect.signature(function).parameters.values()
+            if parameter.default is inspect.Parameter.empty]
+
+
+def _call(workload: Workload, variant: Callable, args: tuple, size: int) -> Any:
+    with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+        if workload.run is None:
+            return variant(*args)
+        return workload.run(variant, args, size)
+
+
+def measure(workload: Workload, variant: Callable, size: int, repeat: int, seed: int = 0,
+            trace_memory: bool = True) -> dict[str, float]:
+    """
+    Runs variant on inputs of the given size, returning its best time in seconds and, unless
+    trace_memory is False, its peak memory in bytes.
+    Arguments are rebuilt before every call, since some variants modify them.
+    """
+    rng = random.Random(seed)
+    best = math.inf
+    for _ in range(repeat):
+        args = workload.make_args(size, rng)
+        start = time.perf_counter()
+        _call(workload, variant, args, size)
+        best = min(best, time.perf_counter() - start)
+    if not trace_memory:
+        return {"time": best}
+    args = workload.make_args(size, rng)
+    tracemalloc.start()
+    try:
+        _call(workload, variant, args, size)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {"time": best, "peak": peak}
+
+
+def scaling_exponent(sizes: list[int], times: list[float]) -> float | None:
+    """
+    Returns the least-squares slope of log(time) against log(size), or None with fewer than two points.
+    """
+    points = [(math.log(size), math.log(max(t, 1e-9))) for size, t in zip(sizes, times)]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    spread = sum((x - mean_x) ** 2 for x, _ in points)
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / spread
+
+
+def run(pattern: str = "", repeat: int = 3) -> dict[str, dict[str, dict]]:
+    """
+    Benchmarks every discovered exercise whose name contains pattern.
+
+    Returns:
+        A dictionary mapping each exercise to a dictionary mapping each variant to its
+        measurements per size ("sizes"), its scaling exponent ("exponent") and, if it
+        failed, the error it raised ("error"); exercises without a registered workload
+        are mapped to an empty dictionary
+    """
+    results = {}
+    for exercise, (path, names) in discover().items():
+        if pattern not in exercise:
+            continue
+        results[exercise] = {}
+        if exercise not in WORKLOADS:
+            continue
+        workload = WORKLOADS[exercise]
+        for name, variant in load_variants(path, names).items():
+            report = {"sizes": {}}
+            for size in workload.sizes:
+                try:
+                    report["sizes"][str(size)] = measure(workload, variant, size, repeat)
+                except Exception as error:
+                    report["error"] = f"{type(error).__name__} at size {size}"
+                    break
+            measured = report["sizes"]
+            report["exponent"] = scaling_exponent([int(size) for size in measured],
+                                                  [m["time"] for m in measured.values()])
+            results[exercise][name] = report
+    return results
+
+
+def regressions(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """
+    Lists the measurements that are more than tolerance (a fraction) slower than in baseline.
+    """
+    slower = []
+    for exercise, variants in results.items():
+        for name, report in variants.items():
+            previous = baseline.get(exercise, {}).get(name, {}).get("sizes", {})
+            for size, measurement in report["sizes"].items():
+                if size in previous and measurement["time"] > previous[size]["time"] * (1 + tolerance):
+                    slower.append(f"{exercise} {name} at size {size}: "
+                                  f"{measurement['time']:.6f}s against {previous[size]['time']:.6f}s")
+    return slower
+
+
+def print_report(results: dict) -> None:
+    for exercise, variants in results.items():
+        print(exercise if variants else f"{exercise}  [no workload]")
+        for name, report in variants.items():
+            cells = [f"{size}: {m['time'] * 1000:.3f}ms {m['peak'] / 1024:.1f}KiB" for size, m in report["sizes"].items()]
+            exponent = report["exponent"]
+            line = f"    {name:<6} " + " | ".join(cells)
+            if exponent is not None:
+                line += f"  (exponent {exponent:.2f})"
+            if "error" in report:
+                line += f"  [{report['error']}]"
+            print(line)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the variants of every lab exercise.")
+    parser.add_argument("pattern", nargs="?", default="", help='only exercises whose name contains this, e.g. "Lab 2/"')
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per size, the best one being kept")
+    parser.add_argument("--save", metavar="FILE", help="store the results as a JSON baseline")
+    parser.add_argument("--compare", metavar="FILE", help="flag regressions against a JSON baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown against the baseline")
+    arguments = parser.parse_args()
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 10_000))
+    results = run(arguments.pattern, arguments.repeat)
+    print_report(results)
+    if arguments.save:
+        with open(arguments.save, "w") as file:
+            json.dump(results, file, indent=2)
+    if arguments.compare:
+        with open(arguments.compare) as file:
+            slower = regressions(results, json.load(file), arguments.tolerance)
+        for line in slower:
+            print("REGRESSION", line)
+        return 1 if slower else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
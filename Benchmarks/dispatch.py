@@ -0,0 +1,160 @@
+"""
+Sends each call of an exercise to whichever of its variants was measured fastest for inputs of that size.
+
+A Dispatcher calibrates itself once, the first time it is called, by timing every variant
+on the workload that bench_variants registers for the exercise, at each of the workload's
+sizes. Each call is then routed to the fastest variant for the nearest calibrated size.
+Calibration can be saved to and reloaded from a JSON profile file, so that it only has to
+be done once per machine.
+
+Before timing them, calibration checks that the variants agree: a variant whose result or
+printed output differs from that of the first variant, or cannot be compared with it, is never chosen.
+If no variant can be timed, calls go to the first variant.
+
+    from dispatch import Dispatcher
+    trim = Dispatcher("Lab 2/ex_3", profile="profile.json")
+    trim([1, 2, 3, 2, 1])     # runs the fastest of f3_1, f3_2, f3_3 for short lists
+    trim.pin("f3_3")          # always use f3_3 from now on
+"""
+import contextlib
+import copy
+import io
+import json
+import math
+import os
+import random
+from typing import Any, Callable
+
+from bench_variants import WORKLOADS, discover, load_variants, measure
+
+
+def _agrees(outcome: tuple[Any, str], reference: tuple[Any, str]) -> bool:
+    """
+    Tells whether two (result, output) pairs are equal. Results must be of the same type,
+    and results that cannot be compared to a truth value, such as NumPy arrays, count as a disagreement.
+    """
+    (result, output), (expected, expected_output) = outcome, reference
+    if type(result) is not type(expected) or output != expected_output:
+        return False
+    try:
+        return bool(result == expected)
+    except Exception:
+        return False
+
+
+class Dispatcher:
+    """
+    Calls the fastest variant of an exercise for the size of its input.
+
+    Attributes:
+        exercise: The exercise name, as in bench_variants ("Lab N/ex_M")
+        variants: The variants that can be chosen from, by name
+        choices: The name of the fastest variant for each calibrated size
+        rejected: The names of the variants that disagreed with the first one
+        pinned: The name of the variant used for every call, if any
+    """
+    def __init__(self, exercise: str, size_of: Callable[..., int] = lambda *args: len(args[0]),
+                 profile: str | None = None, repeat: int = 3):
+        """
+        Args:
+            exercise: The exercise to dispatch, which needs a workload in bench_variants.WORKLOADS
+            size_of: Computes the size of an input from the arguments of a call
+            profile: A JSON file where calibration results are cached
+            repeat: The number of timed runs per variant and size during calibration
+        """
+        path, names = discover()[exercise]
+        self.exercise = exercise
+        self.variants = load_variants(path, names)
+        self.size_of = size_of
+        self.profile = profile
+        self.repeat = repeat
+        self.choices: dict[int, str] = {}
+        self.rejected: set[str] = set()
+        self.pinned: str | None = None
+
+    def pin(self, name: str | None) -> None:
+        """
+        Uses the named variant for every call, or goes back to choosing by size if name is None.
+        """
+        if name is not None and name not in self.variants:
+            raise ValueError(f"{self.exercise} has no variant {name}")
+        self.pinned = name
+
+    def check_agreement(self, size: int, seed: int = 0) -> set[str]:
+        """
+        Runs every variant on the same input of the given size and returns the names of those whose
+        result or printed output differs from the first variant's.
+        """
+        workload = WORKLOADS[self.exercise]
+        args = workload.make_args(size, random.Random(seed))
+        outcomes = {}
+        for name, variant in self.variants.items():
+            output = io.StringIO()
+            try:
+                with contextlib.redirect_stdout(output):
+                    result = variant(*copy.deepcopy(args)) if workload.run is None \
+                        else workload.run(variant, copy.deepcopy(args), size)
+            except Exception as error:
+                result = type(error)
+            outcomes[name] = result, output.getvalue()
+        reference = next(iter(outcomes.values()))
+        return {name for name, outcome in outcomes.items() if not _agrees(outcome, reference)}
+
+    def calibrate(self) -> None:
+        """
+        Checks that the variants agree, then times them at every size of the exercise's workload,
+        and saves the fastest variant for each size to the profile file if there is one.
+        """
+        workload = WORKLOADS[self.exercise]
+        self.rejected = set().union(*(self.check_agreement(size) for size in workload.sizes[:2]))
+        self.choices = {}
+        for size in workload.sizes:
+            times = {}
+            for name, variant in self.variants.items():
+                if name in self.rejected:
+                    continue
+                try:
+                    times[name] = measure(workload, variant, size, self.repeat, trace_memory=False)["time"]
+                except Exception:
+                    continue
+            if times:
+                self.choices[size] = min(times, key=times.get)
+        if self.profile:
+            self._save_profile()
+
+    def _load_profile(self) -> bool:
+        if not self.profile or not os.path.exists(self.profile):
+            return False
+        with open(self.profile) as file:
+            entry = json.load(file).get(self.exercise)
+        if entry is None or not set(entry["choices"].values()) <= self.variants.keys():
+            return False
+        self.choices = {int(size): name for size, name in entry["choices"].items()}
+        self.rejected = set(entry["rejected"])
+        return True
+
+    def _save_profile(self) -> None:
+        profiles = {}
+        if os.path.exists(self.profile):
+            with open(self.profile) as file:
+                profiles = json.load(file)
+        profiles[self.exercise] = {"choices": self.choices, "rejected": sorted(self.rejected)}
+        with open(self.profile, "w") as file:
+            json.dump(profiles, file, indent=2)
+
+    def choose(self, size: int) -> str:
+        """
+        Returns the name of the variant to call for an input of the given size.
+        """
+        if self.pinned is not None:
+            return self.pinned
+        if not self.choices and not self._load_profile():
+            self.calibrate()
+        if not self.choices:
+            # No variant could be timed: fall back on the first one, which the others are checked against
+            return next(iter(self.variants))
+        nearest = min(self.choices, key=lambda calibrated: abs(math.log(calibrated) - math.log(max(size, 1))))
+        return self.choices[nearest]
+
+    def __call__(self, *args) -> Any:
+        return self.variants[self.choose(self.size_of(*args))](*args)
@@ -40,3 +40,36 @@ def f1_4(m: int, n: int) -> str:
     if m == 1:
         return "|" + "_" * n + "|"
     return "|" + "_" * n + "|" + f1_4(m - 1, n)
+
+
+def f1_5(m: int, n: int) -> str:
+    """
+    Creates a pattern of m segments, each containing a pair of vertical bars with n underscores between them.
+    Replaces the recursion of f1_4 with a loop collecting segments, joined once at the end.
+    """
+    segment = "|" + "_" * n + "|"
+    segments = []
+    for _ in range(m):
+        segments.append(segment)
+    return "".join(segments)
+
+
+def write_segments(m: int, n: int, sink, chunk_size: int = 1 << 16, binary: bool | None = None) -> None:
+    """
+    Writes the pattern of f1_1 to sink in chunks of about chunk_size characters, never building the whole string.
+    ASCII bytes are written if binary is True, str if it is False; by default, str is written only to an io.TextIOBase,
+    so text sinks of other types (a text mode SpooledTemporaryFile, for instance) need binary=False.
+    """
+    import io
+    segment = "|" + "_" * n + "|"
+    if binary is None:
+        binary = not isinstance(sink, io.TextIOBase)
+    if binary:
+        segment = segment.encode("ascii")
+    per_chunk = max(1, chunk_size // len(segment))
+    chunk = segment * min(m, per_chunk)
+    full_chunks, remaining = divmod(m, per_chunk)
+    for _ in range(full_chunks):
+        sink.write(chunk)
+    if remaining:
+        sink.write(segment * remaining)
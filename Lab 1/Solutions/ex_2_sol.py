@@ -63,3 +63,61 @@ def f2_5(n: int) -> str:
     return "\n".join([line] * n) + "\n"
 
 
+class BlockCache:
+    """
+    Least-recently-used cache of the blocks built by the f2_* functions, bounded by the total size of the encoded blocks.
+    All variants build the same block for a given n, so one cache serves them all; hits, misses and evictions are counted.
+    """
+    def __init__(self, max_bytes: int = 1 << 24):
+        from collections import OrderedDict
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._blocks = OrderedDict()
+
+    def _entry(self, n: int, build) -> bytes:
+        data = self._blocks.get(n)
+        if data is not None:
+            self.hits += 1
+            self._blocks.move_to_end(n)
+            return data
+        self.misses += 1
+        data = build(n).encode("ascii")
+        if len(data) <= self.max_bytes:
+            self._blocks[n] = data
+            self.size += len(data)
+            while self.size > self.max_bytes:
+                _, evicted = self._blocks.popitem(last=False)
+                self.size -= len(evicted)
+                self.evictions += 1
+        return data
+
+    def get(self, n: int, build=f2_1) -> str:
+        """
+        Returns the block for n, building it with build on a miss.
+        Only the encoded block is cached, so that the cache holds no more than max_bytes; it is decoded on each call.
+        """
+        return self._entry(n, build).decode("ascii")
+
+    def view(self, n: int, build=f2_1) -> memoryview:
+        """
+        Returns a read-only view over the ASCII-encoded block for n, suitable for writing to a socket without copying.
+        """
+        return memoryview(self._entry(n, build))
+
+    def clear(self) -> None:
+        self._blocks.clear()
+        self.size = 0
+
+
+block_cache = BlockCache()
+
+
+def f2_6(n: int) -> str:
+    """
+    Creates a pattern where each of the n lines contains n repetitions of the digit n.
+    Serves repeated requests from the shared block cache, building a missing block with f2_1.
+    """
+    return block_cache.get(n)
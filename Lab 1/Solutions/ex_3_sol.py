@@ -5,4 +5,52 @@ def f3_1(L: list[int]) -> None:
     """
     while len(L) > 1 and L[-2] < L[-1]:
         L.remove(L[-2])
-    print(L)
\ No newline at end of file
+    print(L)
+
+
+def f3_2(L: list[int]) -> list[int]:
+    """
+    Removes the same elements as f3_1, but finds the cut point in a single right-to-left pass and truncates once.
+    Elements are removed by position, so equal values earlier in L are left alone. Returns L instead of printing it.
+    """
+    if len(L) > 1:
+        last = L[-1]
+        i = len(L) - 2
+        while i >= 0 and L[i] < last:
+            i -= 1
+        del L[i + 1:-1]
+    return L
+
+
+def f3_3(lists: list[list[int]]) -> list[list[int]]:
+    """
+    Applies f3_2 to every list of a batch and returns the trimmed lists.
+    """
+    return [f3_2(L) for L in lists]
+
+
+def f3_4(values, offsets):
+    """
+    Batch version of f3_2 over a ragged NumPy representation: row i is values[offsets[i]:offsets[i + 1]].
+    Returns the trimmed rows in the same representation, as a new (values, offsets) pair.
+    """
+    import numpy as np
+    values = np.asarray(values)
+    offsets = np.asarray(offsets, dtype=np.intp)
+    lengths = np.diff(offsets)
+    rows = np.flatnonzero(lengths)
+    if not len(rows):
+        return values[:0].copy(), offsets.copy()
+    positions = np.arange(len(values))
+    row_of = np.repeat(np.arange(len(lengths)), lengths)
+    ends = offsets[1:] - 1
+    is_last = np.zeros(len(values), dtype=bool)
+    is_last[ends[rows]] = True
+    # Last position before the end of its row holding a value at least as large as the row's last value
+    candidates = np.where((values >= values[ends[row_of]]) & ~is_last, positions, -1)
+    cut = np.full(len(lengths), -1)
+    cut[rows] = np.maximum.reduceat(candidates, offsets[rows])
+    keep = (positions <= cut[row_of]) | is_last
+    new_offsets = np.zeros_like(offsets)
+    np.cumsum(np.bincount(row_of[keep], minlength=len(lengths)), out=new_offsets[1:])
+    return values[keep], new_offsets
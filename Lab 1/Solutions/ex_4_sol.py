@@ -74,4 +74,115 @@ def f4_4(D: dict[int, int], n: int) -> list[int]:
         else:
             break
     
-    return result
\ No newline at end of file
+    return result
+
+
+class ChainIndex:
+    """
+    Precomputes the sequences returned by f4_1 for every key of D, so that each query costs O(answer length).
+    Chains are stored as shared paths: each key records the path and offset where its sequence starts,
+    and a path may continue into another one where two chains merge.
+    A chain only moves to larger values, so it can never revisit a key; no cycle check is needed beyond that.
+    Updates leave the paths of rebuilt sequences behind; once they make up most of the stored values, all paths are rebuilt.
+    """
+    def __init__(self, D: dict[int, int]):
+        self._D = dict(D)
+        self._paths = []          # Lists of consecutive chain values
+        self._continuations = []  # For each path, (path, offset) where it carries on, or None
+        self._where = {}          # Key -> (path, offset) where its sequence starts
+        self._predecessors = {}   # Value -> keys whose chain steps to it
+        self._stored = 0          # Number of values in all paths, including those no longer referred to
+        for key, value in self._D.items():
+            if key < value:
+                self._predecessors.setdefault(value, set()).add(key)
+        self._build(self._D)
+
+    def _build(self, keys) -> None:
+        for key in keys:
+            if key in self._where:
+                continue
+            path = [key]
+            continuation = None
+            current = key
+            while current in self._D and current < self._D[current]:
+                current = self._D[current]
+                if current in self._where:
+                    continuation = self._where[current]
+                    break
+                path.append(current)
+            index = len(self._paths)
+            self._paths.append(path)
+            self._continuations.append(continuation)
+            self._stored += len(path)
+            for offset, value in enumerate(path):
+                if value in self._D:
+                    self._where[value] = index, offset
+
+    def _invalidate(self, key: int) -> set[int]:
+        """
+        Forgets where the sequences of key and of every key whose chain runs through it start.
+        """
+        stale = {key}
+        stack = [key]
+        while stack:
+            for predecessor in self._predecessors.get(stack.pop(), ()):
+                if predecessor not in stale:
+                    stale.add(predecessor)
+                    stack.append(predecessor)
+        for value in stale:
+            self._where.pop(value, None)
+        return stale
+
+    def __setitem__(self, key: int, value: int) -> None:
+        if key in self._D:
+            self._unlink(key)
+        stale = self._invalidate(key)
+        self._D[key] = value
+        if key < value:
+            self._predecessors.setdefault(value, set()).add(key)
+        self._rebuild(stale & self._D.keys())
+
+    def __delitem__(self, key: int) -> None:
+        self._unlink(key)
+        stale = self._invalidate(key)
+        del self._D[key]
+        self._rebuild(stale & self._D.keys())
+
+    def _rebuild(self, keys) -> None:
+        # A fresh build stores each key once, plus at most one value ending each path, so at most 2 * len(D) values
+        if self._stored > 4 * len(self._D) + 64:
+            self._paths, self._continuations, self._where, self._stored = [], [], {}, 0
+            keys = self._D
+        self._build(keys)
+
+    def _unlink(self, key: int) -> None:
+        value = self._D[key]
+        if key < value:
+            self._predecessors[value].discard(key)
+
+    def update(self, changes: dict[int, int]) -> None:
+        """
+        Applies the changes made to D, rebuilding only the sequences that go through a changed key.
+        """
+        for key, value in changes.items():
+            self[key] = value
+
+    def query(self, n: int) -> list[int]:
+        """
+        Returns the same list as f4_1(D, n).
+        """
+        if n not in self._where:
+            return []
+        result = []
+        location = self._where[n]
+        while location is not None:
+            index, offset = location
+            result.extend(self._paths[index][offset:])
+            location = self._continuations[index]
+        return result
+
+    def query_many(self, keys) -> list[list[int]]:
+        """
+        Returns the result of query for each of keys.
+        """
+        return [self.query(n) for n in keys]
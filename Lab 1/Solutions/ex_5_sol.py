@@ -1,3 +1,6 @@
+from line_files import complete_lines_end, file_records, resume_offset, save_checkpoint, split_lines
+
+
 def f5_1(filename: str) -> None:
     """
     Reads a file line by line and processes each line using split method.
@@ -45,3 +48,85 @@ def f5_4(filename: str) -> None:
             if len(parts) == 2:
                 name, count = parts
                 print(int(count) * 1000, "people named", name)
+
+
+def _records(buffer, start: int, end: int):
+    """
+    Yields the (name, count) pairs of the lines of buffer[start:end], skipping malformed lines as f5_3 does.
+    Works on bytes for ASCII lines, so only names are decoded.
+    """
+    for line in split_lines(buffer, start, end):
+        parts = line.strip().split(b"," if isinstance(line, bytes) else ",")
+        if len(parts) != 2:
+            continue
+        try:
+            count = int(parts[1])
+        except ValueError:
+            continue
+        name = parts[0]
+        yield name if isinstance(name, str) else name.decode(), count
+
+
+def _write_records(records, out, batch_size: int = 4096) -> None:
+    lines = []
+    for name, count in records:
+        lines.append(f"{count * 1000} people named {name}\n")
+        if len(lines) == batch_size:
+            out.write("".join(lines))
+            lines.clear()
+    out.write("".join(lines))
+
+
+def f5_5(filename: str, out=None, workers: int = 1, range_size: int = 1 << 25) -> None:
+    """
+    Memory-maps the file and parses it as bytes, writing the output of f5_3 in batches to out (standard output by default).
+    With several workers, line-aligned byte ranges of about range_size bytes are parsed in a process pool
+    and written back in file order, with only a few ranges in flight at a time.
+    """
+    import sys
+    out = sys.stdout if out is None else out
+    _write_records(file_records(_records, filename, workers, range_size), out)
+
+
+def f5_6(filename: str) -> tuple:
+    """
+    Memory-maps the file and returns the names and counts of its valid lines instead of printing them.
+    Counts are kept in a compact array of signed 64-bit integers, or in a list as soon as one of them does not fit,
+    since f5_3 prints such lines as any other valid line.
+    """
+    import mmap
+    from array import array
+    names = []
+    counts = array("q")
+    with open(filename, "rb") as file:
+        if not file.seek(0, 2):
+            return names, counts
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            for name, count in _records(buffer, 0, len(buffer)):
+                names.append(name)
+                try:
+                    counts.append(count)
+                except OverflowError:
+                    counts = counts.tolist()
+                    counts.append(count)
+    return names, counts
+
+
+def f5_7(filename: str, checkpoint: str, out=None) -> None:
+    """
+    Follow mode of f5_5 for an append-only file: only complete lines added since the previous run are processed.
+    The offset reached is saved in the checkpoint file; if the file was truncated or rotated, processing restarts from the beginning.
+    """
+    import mmap
+    import sys
+    out = sys.stdout if out is None else out
+    with open(filename, "rb") as file:
+        if not file.seek(0, 2):
+            save_checkpoint(file, b"", checkpoint, 0)
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            start = resume_offset(file, buffer, checkpoint)
+            end = complete_lines_end(buffer, start)
+            if end:
+                _write_records(_records(buffer, start, end), out)
+                save_checkpoint(file, buffer, checkpoint, end)
@@ -1,3 +1,6 @@
+from line_files import complete_lines_end, file_records, resume_offset, save_checkpoint, split_lines
+
+
 def f6_1(filename: str) -> None:
     """
     Reads a file line by line and processes each line using split method.
@@ -47,4 +50,118 @@ def f6_4(filename: str) -> None:
             parts = line.strip().split()
             if len(parts) >= 2:
                 count, symbol = parts[:2]
-                print(int(count) * symbol)
\ No newline at end of file
+                print(int(count) * symbol)
+
+
+def _records(buffer, start: int, end: int):
+    """
+    Yields the (count, symbol) pairs of the lines of buffer[start:end], skipping invalid lines as f6_3 does.
+    """
+    for line in split_lines(buffer, start, end):
+        parts = line.split()
+        if len(parts) != 2:
+            continue
+        try:
+            count = int(parts[0])
+        except ValueError:
+            continue
+        symbol = parts[1]
+        yield count, symbol if isinstance(symbol, str) else symbol.decode()
+
+
+def _write_repeated(out, symbol: str, count: int, block_size: int) -> None:
+    """
+    Writes count copies of symbol to out in blocks of about block_size characters.
+    """
+    per_block = max(1, block_size // len(symbol))
+    block = symbol * min(count, per_block)
+    full_blocks, remaining = divmod(max(count, 0), per_block)
+    for _ in range(full_blocks):
+        out.write(block)
+    out.write(symbol * remaining)
+
+
+def _write_records(records, out, batch_size: int = 4096, block_size: int = 1 << 16) -> None:
+    """
+    Writes the lines of the records to out, joining lines of at most block_size characters in batches of batch_size
+    and writing longer lines in blocks. If reading the records raises an exception,
+    the lines of the records read before are written before it propagates.
+    """
+    lines = []
+    try:
+        for count, symbol in records:
+            if count * len(symbol) <= block_size:
+                lines.append(count * symbol + "\n")
+                if len(lines) < batch_size:
+                    continue
+            batch = "".join(lines)
+            lines.clear()
+            out.write(batch)
+            if count * len(symbol) > block_size:
+                _write_repeated(out, symbol, count, block_size)
+                out.write("\n")
+    finally:
+        out.write("".join(lines))
+
+
+def _within_budgets(records, max_line: int | None, max_total: int | None):
+    """
+    Yields the records, raising ValueError on the first one whose line would print more than max_line characters
+    or take the whole output beyond max_total characters.
+    """
+    total = 0
+    for count, symbol in records:
+        size = max(count, 0) * len(symbol)
+        if max_line is not None and size > max_line:
+            raise ValueError(f"{count} {symbol} would print {size} characters, "
+                             f"more than the limit of {max_line} per line")
+        total += size + 1
+        if max_total is not None and total > max_total:
+            raise ValueError(f"Output would exceed the limit of {max_total} characters")
+        yield count, symbol
+
+
+def f6_5(filename: str, out=None, workers: int = 1, range_size: int = 1 << 25) -> None:
+    """
+    Memory-maps the file and parses it as bytes, producing the output of f6_3 on out (standard output by default).
+    With several workers, ranges of whole lines of about range_size bytes are parsed in a process pool
+    and their output is written in file order, with only a few ranges in flight at a time.
+    """
+    import sys
+    out = sys.stdout if out is None else out
+    _write_records(file_records(_records, filename, workers, range_size), out)
+
+
+def f6_6(filename: str, out=None, max_line: int | None = None, max_total: int | None = None,
+         block_size: int = 1 << 16, workers: int = 1, range_size: int = 1 << 25) -> None:
+    """
+    Produces the output of f6_3 on out (standard output by default), joining short lines in batches as f6_5 does
+    but never building a line of more than block_size characters in memory.
+    Raises ValueError, after writing the lines before it, on a line that would print more than max_line characters
+    or take the whole output beyond max_total characters.
+    With several workers, lines are parsed in a process pool as by f6_5, and the budgets still apply.
+    """
+    import sys
+    out = sys.stdout if out is None else out
+    records = file_records(_records, filename, workers, range_size)
+    _write_records(_within_budgets(records, max_line, max_total), out, block_size=block_size)
+
+
+def f6_7(filename: str, checkpoint: str, out=None) -> None:
+    """
+    Processes only the complete lines appended to the file since the last call, as f6_5 would print them.
+    Progress is kept in the checkpoint file, and a truncated or rotated file is processed again from the start.
+    """
+    import mmap
+    import sys
+    out = sys.stdout if out is None else out
+    with open(filename, "rb") as file:
+        if not file.seek(0, 2):
+            save_checkpoint(file, b"", checkpoint, 0)
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            start = resume_offset(file, buffer, checkpoint)
+            end = complete_lines_end(buffer, start)
+            if end:
+                _write_records(_records(buffer, start, end), out)
+                save_checkpoint(file, buffer, checkpoint, end)
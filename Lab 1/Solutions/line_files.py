@@ -0,0 +1,137 @@
+"""
+Helpers shared by the memory-mapped line processors of ex_5 and ex_6:
+splitting bytes into lines as text files are read, cutting a file into ranges of whole lines
+processed by worker processes, and the checkpoint of the follow modes.
+"""
+import re
+
+# Bytes after which a line can no longer be handled as ASCII bytes: \r also ends lines in text mode,
+# \x1c to \x1f are whitespace for str.split() and str.strip(), and non-ASCII lines may hold other whitespace
+_UNUSUAL = re.compile(rb"[\r\x1c-\x1f\x80-\xff]")
+
+
+def split_lines(buffer, start: int, end: int, block_size: int = 1 << 20):
+    """
+    Yields the lines of buffer[start:end] without their line endings, split as a file opened in text mode splits them
+    (at \n, \r and \r\n), possibly with extra empty lines, which both line processors skip.
+    Plain ASCII lines are yielded as bytes; lines with other characters are decoded from UTF-8 and yielded as str,
+    so that splitting and stripping them treat the same characters as whitespace as str methods do.
+    The buffer is read in blocks of whole lines of about block_size bytes.
+    """
+    while start < end:
+        stop = buffer.find(b"\n", min(start + block_size, end) - 1, end) + 1 or end
+        block = buffer[start:stop]
+        start = stop
+        if _UNUSUAL.search(block) is None:
+            yield from block.split(b"\n")
+            continue
+        for line in block.split(b"\n"):
+            if _UNUSUAL.search(line) is None:
+                yield line
+            else:
+                yield from line.decode().split("\r")
+
+
+def complete_lines_end(buffer, start: int) -> int:
+    """
+    Returns the offset just after the last line ending at or after start, or 0 if there is none.
+    """
+    return max(buffer.rfind(b"\n", start), buffer.rfind(b"\r", start)) + 1
+
+
+def line_ranges(buffer, range_size: int) -> list[tuple[int, int]]:
+    """
+    Splits buffer into byte ranges of about range_size bytes, each ending just after a newline (or at the end of buffer).
+    """
+    size = len(buffer)
+    ranges = []
+    start = 0
+    while start < size:
+        end = buffer.find(b"\n", min(start + range_size, size) - 1) + 1 or size
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+def map_ranges(process, filename: str, ranges, workers: int, lookahead: int | None = None):
+    """
+    Yields process(filename, start, end) for each range, in order, computing them in a pool of worker processes.
+    At most lookahead results (twice the number of workers by default) are pending or held at any time.
+    """
+    from collections import deque
+    from concurrent.futures import ProcessPoolExecutor
+    lookahead = 2 * workers if lookahead is None else lookahead
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for start, end in ranges:
+            pending.append(executor.submit(process, filename, start, end))
+            if len(pending) >= lookahead:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def parse_range(records, filename: str, start: int, end: int) -> list:
+    """
+    Returns the list of the records of the lines between the two byte offsets, to be run in a worker process.
+    """
+    import mmap
+    with open(filename, "rb") as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            return list(records(buffer, start, end))
+
+
+def file_records(records, filename: str, workers: int = 1, range_size: int = 1 << 25):
+    """
+    Yields the records of the lines of the memory-mapped file, in order.
+    With several workers, ranges of whole lines of about range_size bytes are parsed in a process pool,
+    with only a few ranges in flight at a time; the records, not the output, are sent back,
+    so the output of a line is never built in a worker.
+    """
+    import mmap
+    with open(filename, "rb") as file:
+        if not file.seek(0, 2):
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            if workers <= 1:
+                yield from records(buffer, 0, len(buffer))
+                return
+            ranges = line_ranges(buffer, range_size)
+    from functools import partial
+    for chunk in map_ranges(partial(parse_range, records), filename, ranges, workers):
+        yield from chunk
+
+
+def resume_offset(file, buffer, checkpoint: str) -> int:
+    """
+    Returns the offset saved in the checkpoint file, or 0 if there is none
+    or if the file has since been truncated or replaced (different inode or different head).
+    """
+    import hashlib
+    import json
+    import os
+    try:
+        with open(checkpoint) as state_file:
+            state = json.load(state_file)
+    except FileNotFoundError:
+        return 0
+    if state["inode"] != os.fstat(file.fileno()).st_ino or state["offset"] > len(buffer):
+        return 0
+    if hashlib.sha256(buffer[:state["head_size"]]).hexdigest() != state["head"]:
+        return 0
+    return state["offset"]
+
+
+def save_checkpoint(file, buffer, checkpoint: str, offset: int, head_size: int = 4096) -> None:
+    """
+    Records offset together with a fingerprint of the head of the file, replacing the checkpoint file atomically.
+    """
+    import hashlib
+    import json
+    import os
+    head_size = min(offset, head_size)
+    state = {"offset": offset, "inode": os.fstat(file.fileno()).st_ino, "head_size": head_size,
+             "head": hashlib.sha256(buffer[:head_size]).hexdigest()}
+    with open(checkpoint + ".tmp", "w") as state_file:
+        json.dump(state, state_file)
+    os.replace(checkpoint + ".tmp", checkpoint)
@@ -1,15 +1,64 @@
-# Loop until valid input is received
-while True:
-    try:
-        # Prompt user for input and convert to float
-        num = float(input('Enter a floating point number between -1 and 1 excluded: '))
-        # Validate if number is within range (-1, 1)
-        if not (-1 < num < 1):
-            raise ValueError
-        # Exit loop if input is valid
-        break
-    except ValueError:
-        # Handle invalid input (non-numeric or out of range)
-        print('You got that wrong, try again!\n')
-# Display the input value, formatted to 2 decimal places (rounding to nearest 0.01)
-print(f'\nUp to +/-0.005, you input {num:.2f}')
\ No newline at end of file
+import sys
+
+
+def bulk_validate(lines, accepted, rejected, chunk_size: int = 1 << 16) -> None:
+    """
+    Validate many candidate inputs at once instead of prompting for them one by one.
+
+    Each line of lines is a candidate. Those that are floating point numbers strictly
+    between -1 and 1 are written to accepted, formatted to 2 decimal places as the
+    interactive prompt displays them; all other lines are written unchanged to rejected.
+    The range check and the formatting are done with NumPy on chunks of chunk_size lines.
+
+    Args:
+        lines: An iterable of strings, such as an open file
+        accepted: A writable text stream for the accepted values
+        rejected: A writable text stream for the rejected candidates
+        chunk_size: The number of lines processed together
+    """
+    from itertools import islice
+    import numpy as np
+
+    def to_float(candidate: str) -> float:
+        # Anything float() refuses becomes NaN, which fails the range check below
+        try:
+            return float(candidate)
+        except ValueError:
+            return float('nan')
+
+    lines = iter(lines)
+    while chunk := [line.rstrip('\n') for line in islice(lines, chunk_size)]:
+        values = np.fromiter(map(to_float, chunk), dtype=float, count=len(chunk))
+        in_range = (-1 < values) & (values < 1)
+        if in_range.any():
+            accepted.write('\n'.join(np.char.mod('%.2f', values[in_range])) + '\n')
+        if not in_range.all():
+            rejected.write('\n'.join(np.array(chunk, dtype=object)[~in_range]) + '\n')
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        # Bulk mode: python ex_1_sol.py candidates.txt [accepted.txt rejected.txt]
+        # Without output files, accepted values go to standard output and rejected ones to standard error
+        with open(sys.argv[1]) as candidates:
+            if len(sys.argv) > 3:
+                with open(sys.argv[2], 'w') as accepted, open(sys.argv[3], 'w') as rejected:
+                    bulk_validate(candidates, accepted, rejected)
+            else:
+                bulk_validate(candidates, sys.stdout, sys.stderr)
+        sys.exit()
+    # Loop until valid input is received
+    while True:
+        try:
+            # Prompt user for input and convert to float
+            num = float(input('Enter a floating point number between -1 and 1 excluded: '))
+            # Validate if number is within range (-1, 1)
+            if not (-1 < num < 1):
+                raise ValueError
+            # Exit loop if input is valid
+            break
+        except ValueError:
+            # Handle invalid input (non-numeric or out of range)
+            print('You got that wrong, try again!\n')
+    # Display the input value, formatted to 2 decimal places (rounding to nearest 0.01)
+    print(f'\nUp to +/-0.005, you input {num:.2f}')
@@ -29,3 +29,118 @@ def f2(text: str) -> str:
     # Rejoin the processed words with spaces and return the result
     return " ".join(words)
 
+
+def f2_stream(chunks):
+    """
+    Capitalize words at the beginning of sentences in a text given as a stream of chunks.
+    
+    Words are cased exactly as f2 cases them, but the original whitespace is kept,
+    and only one chunk (plus any word cut by the end of the previous chunk) is held
+    in memory at a time, so arbitrarily large texts can be processed.
+    
+    Whether the next word starts a sentence is carried from one chunk to the next,
+    and a word cut in two by a chunk boundary is held back until it is complete.
+    
+    Args:
+        chunks: An iterable of strings, such as iter(lambda: file.read(1 << 20), '')
+        
+    Yields:
+        str: The processed text, piece by piece
+    """
+    import re
+    token = re.compile(r'\s+|\S+')
+    # The first word of the text starts a sentence
+    starts_sentence = True
+    pending = ''
+    
+    def process(text):
+        nonlocal starts_sentence
+        pieces = []
+        for match in token.finditer(text):
+            piece = match.group()
+            if piece[0].isspace():
+                pieces.append(piece)
+            else:
+                pieces.append(piece.title() if starts_sentence else piece.lower())
+                starts_sentence = piece[-1] in ".!?"
+        return ''.join(pieces)
+    
+    for chunk in chunks:
+        # Hold back a trailing word, which may continue in the next chunk
+        end = len(chunk)
+        while end and not chunk[end - 1].isspace():
+            end -= 1
+        if not end:
+            pending += chunk
+            continue
+        yield process(pending + chunk[:end])
+        pending = chunk[end:]
+    if pending:
+        yield process(pending)
+
+
+def f2_parallel(text: str, workers: int | None = None, chunk_size: int = 1 << 20) -> str:
+    """
+    Capitalize words at the beginning of sentences in a text, using several processes.
+    
+    The text is cut into chunks of roughly chunk_size characters, each cut being made
+    right after a word ending with a sentence-ending punctuation mark. Every chunk
+    therefore starts a sentence, just like the whole text, so the chunks can be processed
+    independently with f2 in a process pool. Joining the results with spaces gives
+    exactly what f2 returns for the whole text.
+    
+    Args:
+        text (str): The input text to process
+        workers (int | None): The number of worker processes (by default, one per CPU)
+        chunk_size (int): The approximate number of characters per chunk
+        
+    Returns:
+        str: The processed text, identical to f2(text)
+    """
+    import re
+    from concurrent.futures import ProcessPoolExecutor
+    # A sentence-ending punctuation mark closes a word when whitespace follows it
+    sentence_end = re.compile(r'[.!?](?=\s)')
+    chunks = []
+    start = 0
+    while len(text) - start > chunk_size:
+        match = sentence_end.search(text, start + chunk_size)
+        if not match:
+            break
+        chunks.append(text[start:match.end()])
+        start = match.end()
+    chunks.append(text[start:])
+    if len(chunks) == 1:
+        return f2(text)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return " ".join(result for result in executor.map(f2, chunks) if result)
+
+
+def benchmark_f2_parallel(size_mb: int = 16, worker_counts: tuple[int, ...] = (1, 2, 4, 8)) -> None:
+    """
+    Prints the throughput of f2 and of f2_parallel with various numbers of workers, in MB/s,
+    on a generated text of about size_mb megabytes.
+    
+    Args:
+        size_mb (int): The size of the generated text in megabytes
+        worker_counts (tuple[int, ...]): The numbers of workers to try
+    """
+    import random
+    import time
+    words = ["the", "Quick", "BROWN", "fox.", "jumps", "over!", "a", "lazy", "dog?", "and", "runs"]
+    rng = random.Random(0)
+    text = " ".join(rng.choices(words, k=size_mb * (1 << 20) // 5))
+    size = len(text.encode()) / (1 << 20)
+    start = time.perf_counter()
+    expected = f2(text)
+    print(f"f2: {size / (time.perf_counter() - start):.1f} MB/s")
+    for workers in worker_counts:
+        start = time.perf_counter()
+        result = f2_parallel(text, workers)
+        elapsed = time.perf_counter() - start
+        assert result == expected
+        print(f"f2_parallel with {workers} worker(s): {size / elapsed:.1f} MB/s")
+
+
+if __name__ == "__main__":
+    benchmark_f2_parallel()
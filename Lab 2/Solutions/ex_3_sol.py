@@ -1,3 +1,6 @@
+from collections.abc import Sequence
+
+
 def f3_1(L: list) -> list:
     """
     Remove matching elements from both ends of the list until they no longer match.
@@ -60,4 +63,88 @@ def f3_3(L: list) -> list:
     while i < len(L) // 2 and L[i] == L[-i-1]:
         i += 1
     # Return the middle portion of the list
-    return L[i:len(L)-i]
\ No newline at end of file
+    return L[i:len(L)-i]
+
+
+def trim_depth(L) -> int:
+    """
+    Count how many pairs of matching elements f3_1..f3_3 would remove from both ends.
+    
+    For NumPy arrays and buffers such as array.array, the first half of the sequence
+    is compared with the reversed second half in a single vectorised operation, without
+    copying any element. Other sequences are compared pair by pair, as in f3_3.
+    
+    Args:
+        L: A list, a one-dimensional NumPy array, or an object supporting the buffer protocol
+        
+    Returns:
+        int: The number of elements to remove from each end
+    """
+    half = len(L) // 2
+    if not isinstance(L, (list, tuple)):
+        import numpy as np
+        a = L if isinstance(L, np.ndarray) else np.asarray(memoryview(L))
+        matches = a[:half] == a[::-1][:half]
+        return half if matches.all() else int(matches.argmin())
+    i = 0
+    while i < half and L[i] == L[-i - 1]:
+        i += 1
+    return i
+
+
+def f3_4(L):
+    """
+    Remove matching elements from both ends without copying any element.
+    
+    Only the trim depth is computed; the result is a view over the middle of L:
+    a slice for a NumPy array, a memoryview slice for array.array and other buffers,
+    and a TrimmedView for lists and tuples. Changes made to L afterwards show through the view.
+    
+    Args:
+        L: A list, a one-dimensional NumPy array, or an object supporting the buffer protocol
+        
+    Returns:
+        A read-only or shared view over L with matching end elements left out
+    """
+    i = trim_depth(L)
+    if isinstance(L, (list, tuple)):
+        return TrimmedView(L, i, len(L) - i)
+    if hasattr(L, '__array_interface__'):
+        return L[i:len(L) - i]
+    return memoryview(L)[i:len(L) - i]
+
+
+class TrimmedView(Sequence):
+    """
+    A read-only view over the elements of a list from index start (included) to index stop (excluded).
+    
+    Attributes:
+        L: The underlying list
+        start: The index in L of the first element of the view
+        stop: The index in L following the last element of the view
+    """
+    def __init__(self, L, start: int, stop: int):
+        self.L = L
+        self.start = start
+        self.stop = stop
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def __getitem__(self, i):
+        """
+        Get the element of index i in the view, or a smaller view if i is a slice with step 1.
+        """
+        if isinstance(i, slice):
+            start, stop, step = i.indices(len(self))
+            if step == 1:
+                return TrimmedView(self.L, self.start + start, self.start + max(start, stop))
+            return [self.L[self.start + j] for j in range(start, stop, step)]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError('TrimmedView index out of range')
+        return self.L[self.start + i]
+
+    def __repr__(self) -> str:
+        return f'TrimmedView({self.L[self.start:self.stop]!r})'
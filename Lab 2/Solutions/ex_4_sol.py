@@ -94,4 +94,120 @@ def f4_3(L: list) -> list:
             # Keep element and move to next
             return helper(lst, idx+1)
     
-    return helper(L.copy())  # Use a copy to avoid modifying the original list
\ No newline at end of file
+    return helper(L.copy())  # Use a copy to avoid modifying the original list
+
+
+def _positions_to_remove(L, repeats: list[int]) -> list[int]:
+    """
+    Find the positions of the elements that f4_2 leaves out, jumping over runs that cannot match.
+    
+    With d elements removed so far, the element at position j is removed when L[j] - j == -d.
+    As L is increasing, L[j] - j only goes down at repeated values, by 1 each time, and
+    never decreases between two of them. So:
+    - if L[j] - j is larger than -d by g, no position can match before the g-th next
+      repeated value; if there are fewer left, nothing else matches;
+    - if L[j] - j is smaller than -d, the first position up to the next repeated value
+      where L[k] - k reaches -d, if any, is found by binary search.
+    
+    Args:
+        L: A list of integers in increasing order
+        repeats: The positions k such that L[k] == L[k - 1], in increasing order
+        
+    Returns:
+        The positions of the elements to remove, in increasing order
+    """
+    from bisect import bisect_left, bisect_right
+    
+    positions = []
+    j = 0
+    while j < len(L):
+        gap = L[j] - j + len(positions)
+        if not gap:
+            positions.append(j)
+            j += 1
+            continue
+        r = bisect_right(repeats, j)
+        if gap > 0:
+            if r + gap > len(repeats):
+                break
+            j = repeats[r + gap - 1]
+        else:
+            run_end = repeats[r] if r < len(repeats) else len(L)
+            j = bisect_left(range(j + 1, run_end), -len(positions), key=lambda k: L[k] - k) + j + 1
+    return positions
+
+
+def f4_4(L: list) -> list:
+    """
+    Remove elements equal to their indices, skipping over the elements that cannot match.
+    
+    Instead of examining every element, this implementation uses the order of L
+    to jump from one possible match to the next (see _positions_to_remove), and then
+    copies the slices between the removed elements. There is no recursion, and the
+    Python loop only stops at matches and repeated values, with O(log n) comparisons
+    at each stop, so values that run a constant gap ahead of or behind their indices
+    are skipped at once. The repeated values are found first, by iterating over L in C;
+    when they make up more than an eighth of L, as in [0, 0, 1, 1, 2, 2, ...], stopping
+    at each of them would cost more than examining every element, so f4_2 is used instead.
+    
+    Time complexity: O(k log n) comparisons for k stops (at most n / 8), plus O(n) in C
+    to find the repeated values and copy the result
+    Space complexity: O(n) for the result list
+    
+    Args:
+        L: A list of integers (assumed to be in increasing order)
+        
+    Returns:
+        A new list with elements equal to their indices removed
+    """
+    from itertools import compress, count, islice
+    from operator import eq
+    
+    repeats = list(compress(count(1), map(eq, islice(L, 1, None), L)))
+    if len(repeats) > len(L) // 8:
+        return f4_2(L)
+    positions = _positions_to_remove(L, repeats)
+    if not positions:
+        return L.copy()
+    ans = []
+    start = 0
+    for position in positions:
+        ans.extend(L[start:position])
+        start = position + 1
+    ans.extend(L[start:])
+    return ans
+
+
+def remove_fixed_points(L):
+    """
+    Remove elements equal to their indices from a NumPy array of integers, without a Python loop.
+    
+    With d(j) elements removed before position j, the element at position j is removed
+    when L[j] - j + d(j) == 0. Before the first position where L[j] - j >= 0, this sum
+    is negative, so nothing is removed. From there on it never becomes negative again:
+    it goes down by at most 1 per position, and goes back up by 1 at each removal. So
+    d(j) only grows when needed to keep L[k] - k + d(k) >= 1 after each removal k, that is,
+    d(j) = max(0, max(1 - (L[k] - k) for the positions k before j from that point on)),
+    which is a cumulative maximum. All matching elements are then removed with a single np.delete.
+    
+    Unlike the f4_* variants, this takes and returns arrays, so it is named apart from them.
+    
+    Args:
+        L: A one-dimensional array of integers (assumed to be in increasing order);
+           other sequences are converted with np.asarray
+        
+    Returns:
+        A new NumPy array with elements equal to their indices removed
+    """
+    import numpy as np
+    
+    L = np.asarray(L)
+    offsets = L - np.arange(len(L))
+    start = int(np.argmax(offsets >= 0)) if len(L) else 0
+    if not len(L) or offsets[start] < 0:
+        return L.copy()
+    offsets = offsets[start:]
+    removed_before = np.zeros_like(offsets)
+    np.maximum.accumulate(1 - offsets[:-1], out=removed_before[1:])
+    np.maximum(removed_before, 0, out=removed_before)
+    return np.delete(L, np.flatnonzero(offsets + removed_before == 0) + start)
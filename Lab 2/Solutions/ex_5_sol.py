@@ -92,4 +92,103 @@ def f5_3(L: list) -> dict:
         if min(window[0], window[2]) < window[1] < max(window[0], window[2]):
             result[window[1]] = (min(window[0], window[2]), max(window[0], window[2]))
     
-    return result
\ No newline at end of file
+    return result
+
+
+def between_neighbours(L):
+    """
+    Find elements between their circular neighbors with NumPy, returning arrays.
+    
+    The previous and next neighbors of every element are obtained at once by rolling
+    the array one position each way; their elementwise minimum and maximum are then
+    compared with the array to build a mask of the qualifying elements.
+    
+    Time complexity: O(n), vectorised
+    Space complexity: O(n) for the rolled arrays and the mask
+    
+    Args:
+        L: A list or one-dimensional NumPy array of integers
+        
+    Returns:
+        Three arrays: the qualifying elements, in order of position, and the min and
+        max of their neighbors. Duplicate values all appear; building a dictionary
+        from them in order keeps the last one, as f5_1 does.
+    """
+    import numpy as np
+    
+    a = np.asarray(L)
+    previous = np.roll(a, 1)
+    following = np.roll(a, -1)
+    low = np.minimum(previous, following)
+    high = np.maximum(previous, following)
+    mask = (low < a) & (a < high)
+    return a[mask], low[mask], high[mask]
+
+
+def f5_4(L: list) -> dict:
+    """
+    Find elements between their circular neighbors using NumPy.
+    
+    Builds the same dictionary as f5_1 from the arrays computed by between_neighbours.
+    
+    Time complexity: O(n)
+    Space complexity: O(n)
+    
+    Args:
+        L: A list of integers
+        
+    Returns:
+        Dictionary mapping qualified elements to tuples of their min and max neighbors
+    """
+    values, low, high = between_neighbours(L)
+    return dict(zip(values.tolist(), zip(low.tolist(), high.tolist())))
+
+
+def f5_5(iterable) -> dict:
+    """
+    Find elements between their circular neighbors in a stream of integers.
+    
+    Elements are read one at a time and only a window of three is kept, along with
+    the first two elements: they are needed at the end to check the last element
+    (whose next neighbor is the first one) and the first element (whose previous
+    neighbor is the last one). The first element is checked last, but placed first in
+    the dictionary, and a later equal element still wins, exactly as with f5_1.
+    
+    Time complexity: O(n)
+    Space complexity: O(k) where k is the number of elements that meet the criteria
+    
+    Args:
+        iterable: Any iterable of integers, possibly too large to fit in memory
+        
+    Returns:
+        Dictionary mapping qualified elements to tuples of their min and max neighbors
+    """
+    def check(prev_val, curr_val, next_val, result):
+        low, high = min(prev_val, next_val), max(prev_val, next_val)
+        if low < curr_val < high:
+            result[curr_val] = (low, high)
+    
+    iterator = iter(iterable)
+    first_two = []
+    for x in iterator:
+        first_two.append(x)
+        if len(first_two) == 2:
+            break
+    else:
+        # With fewer than three elements, both neighbors of each element are the same value
+        return {}
+    result = {}
+    prev_val, curr_val = first_two
+    count = 2
+    for next_val in iterator:
+        check(prev_val, curr_val, next_val, result)
+        prev_val, curr_val = curr_val, next_val
+        count += 1
+    if count == 2:
+        return {}
+    # The last element, whose next neighbor is the first element
+    check(prev_val, curr_val, first_two[0], result)
+    # The first element, whose previous neighbor is the last element
+    first = {}
+    check(curr_val, first_two[0], first_two[1], first)
+    return {**first, **result}
@@ -113,4 +113,178 @@ def f6_4(n: int) -> None:
             return
         decompose(num // 2, k + 1)
     
-    decompose(n)
\ No newline at end of file
+    decompose(n)
+
+
+def f6_5(values) -> tuple:
+    """
+    Decompose many integers at once into the form 2^k * m where m is odd (or 0).
+    
+    Instead of dividing or shifting bit by bit, this approach isolates the lowest set
+    bit of every integer with n & -n, which is exactly 2^k, reads k off that power of
+    two, and shifts each integer right by its own k, all in single vectorised passes.
+    
+    Time complexity: O(N) for N integers, with no loop in Python
+    Space complexity: O(N) for the result arrays
+    
+    Args:
+        values: A sequence of integers or a NumPy array, all fitting in 64 bits
+        
+    Returns:
+        Two int64 arrays k and m such that values = 2^k * m with m odd, except that
+        k and m are both 0 where the integer is 0. Pass them to format_decompositions
+        for the text printed by f6_1.
+    """
+    import numpy as np
+    
+    a = np.asarray(values, dtype=np.int64)
+    # As unsigned, the lowest set bit of -2^63 is 2^63 rather than a negative number
+    lowest_bit = (a & -a).view(np.uint64)
+    k = np.log2(np.where(lowest_bit == 0, 1, lowest_bit)).astype(np.int64)
+    return k, a >> k
+
+
+def format_decompositions(values, k, m) -> str:
+    """
+    Format decompositions computed by f6_5 as the lines f6_1 prints, one per integer.
+    
+    Args:
+        values: The decomposed integers
+        k: The powers of 2 returned by f6_5
+        m: The odd parts returned by f6_5
+        
+    Returns:
+        The text to print, with a newline after each line
+    """
+    lines = []
+    for n, power, odd in zip(values, k.tolist(), m.tolist()):
+        if n == 0:
+            lines.append('0 = 2^k * 0 for all integers k!\n')
+        else:
+            lines.append(f"{n} = {'-' if n < 0 else ''}2^{power} * {abs(odd)}\n")
+    return ''.join(lines)
+
+
+def to_decimal(n: int):
+    """
+    Convert a non-negative integer to decimal.Decimal in subquadratic time.
+    
+    The binary halves are converted recursively and recombined as high * 2^w + low,
+    letting the decimal module's fast multiplication do the work.
+    
+    Args:
+        n: A non-negative integer
+        
+    Returns:
+        A decimal.Decimal equal to n, with exponent 0
+    """
+    import decimal
+    
+    context = decimal.Context(prec=decimal.MAX_PREC, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN)
+    powers_of_two = {}
+    
+    def power_of_two(w):
+        if w not in powers_of_two:
+            if w <= 1024:
+                powers_of_two[w] = decimal.Decimal(1 << w)
+            else:
+                powers_of_two[w] = context.multiply(power_of_two(w >> 1), power_of_two(w - (w >> 1)))
+        return powers_of_two[w]
+    
+    def convert(num, width):
+        if width <= 1024:
+            return decimal.Decimal(num)
+        half = width >> 1
+        high = convert(num >> half, width - half)
+        low = convert(num & ((1 << half) - 1), half)
+        return context.add(context.multiply(high, power_of_two(half)), low)
+    
+    return convert(n, n.bit_length())
+
+
+def _decimal_string(n: int) -> str:
+    """
+    Convert a non-negative integer to its decimal string in subquadratic time.
+    
+    str() is quadratic in the number of digits, and refuses integers with more than
+    sys.get_int_max_str_digits() digits. Large integers are converted with to_decimal
+    instead, and the resulting Decimal is written out in linear time.
+    
+    Args:
+        n: A non-negative integer
+        
+    Returns:
+        The decimal representation of n
+    """
+    if n.bit_length() <= 14_000:  # At most 4215 digits, below the default limit of str()
+        return str(n)
+    return str(to_decimal(n))
+
+
+def f6_6(n: int) -> None:
+    """
+    Decompose an integer n into the form 2^k * m, with a fast path for huge integers.
+    
+    The loops of f6_1 and f6_2 copy the whole integer at every step, which is quadratic
+    for integers with many factors of 2. Here the lowest set bit, n & -n, is 2^k, so its
+    bit length gives k at once and m is obtained with a single shift. Both n and m are
+    converted to decimal with _decimal_string, which avoids the quadratic conversion
+    of str() and its limit on the number of digits.
+    
+    Time complexity: O(log n) for the decomposition, subquadratic for the output
+    Space complexity: O(log n)
+    
+    Args:
+        n: The integer to decompose
+    """
+    if n == 0:
+        print('0 = 2^k * 0 for all integers k!')
+        return
+    abs_n = abs(n)
+    k = (abs_n & -abs_n).bit_length() - 1
+    sign = '-' if n < 0 else ''
+    print(f'{sign}{_decimal_string(abs_n)} = {sign}2^{k} * {_decimal_string(abs_n >> k)}')
+
+
+def benchmark_f6_6(bit_sizes: tuple[int, ...] = (10_000, 100_000, 1_000_000, 4_000_000)) -> None:
+    """
+    Print how long the decomposition and the conversion to decimal take for integers of
+    the given sizes in bits, half of which are trailing zeros, comparing the bit-by-bit
+    loop of f6_2 with the lowest-set-bit approach of f6_6, and str() with _decimal_string.
+    The quadratic approaches are only timed up to 200,000 bits.
+    
+    Args:
+        bit_sizes: The numbers of bits of the integers to try
+    """
+    import random
+    import sys
+    import time
+    
+    rng = random.Random(0)
+    for bits in bit_sizes:
+        n = (rng.getrandbits(bits - bits // 2) | 1) << (bits // 2)
+        line = f'{bits:>9} bits:'
+        if bits <= 200_000:
+            start = time.perf_counter()
+            m = n
+            while (m & 1) == 0:
+                m >>= 1
+            line += f'  shift loop {time.perf_counter() - start:8.4f}s'
+        start = time.perf_counter()
+        m = n >> ((n & -n).bit_length() - 1)
+        line += f'  lowest set bit {time.perf_counter() - start:8.6f}s'
+        if bits <= 200_000:
+            limit = sys.get_int_max_str_digits()
+            sys.set_int_max_str_digits(0)
+            start = time.perf_counter()
+            str(m)
+            line += f'  str {time.perf_counter() - start:8.4f}s'
+            sys.set_int_max_str_digits(limit)
+        start = time.perf_counter()
+        _decimal_string(m)
+        line += f'  _decimal_string {time.perf_counter() - start:8.4f}s'
+        print(line)
+
+
+if __name__ == '__main__':
+    benchmark_f6_6()
@@ -114,4 +114,96 @@ def f2_6(n: int) -> None:
         # Recursively process the rest of the number
         return number_to_squares(num // 10) + square
     
-    print(number_to_squares(n))
\ No newline at end of file
+    print(number_to_squares(n))
+
+
+def _to_decimal(n: int):
+    """
+    Converts a non-negative integer to decimal.Decimal in subquadratic time, as to_decimal
+    of Lab 2 ex_6 does: the binary halves are converted recursively and recombined as
+    high * 2^w + low, letting the decimal module's fast multiplication do the work.
+    """
+    import decimal
+    
+    context = decimal.Context(prec=decimal.MAX_PREC, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN)
+    powers_of_two = {}
+    
+    def power_of_two(w):
+        if w not in powers_of_two:
+            if w <= 1024:
+                powers_of_two[w] = decimal.Decimal(1 << w)
+            else:
+                powers_of_two[w] = context.multiply(power_of_two(w >> 1), power_of_two(w - (w >> 1)))
+        return powers_of_two[w]
+    
+    def convert(num, width):
+        if width <= 1024:
+            return decimal.Decimal(num)
+        half = width >> 1
+        high = convert(num >> half, width - half)
+        low = convert(num & ((1 << half) - 1), half)
+        return context.add(context.multiply(high, power_of_two(half)), low)
+    
+    return convert(n, n.bit_length())
+
+
+def _digit_chunks(n: int, chunk_digits: int = 2000):
+    """
+    Yields the decimal digits of a non-negative integer, from left to right, in strings
+    of at most chunk_digits digits.
+    
+    After a single conversion to Decimal, the number is split recursively by powers
+    10**k with k = chunk_digits * 2**i. With Decimal, dividing by a power of 10 only
+    moves the decimal point, so every level of the recursion takes linear time.
+    
+    Args:
+        n: A non-negative integer
+        chunk_digits: The maximum number of digits per string
+    """
+    import decimal
+    
+    context = decimal.Context(prec=decimal.MAX_PREC, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN)
+    d = _to_decimal(n)
+    level = 0
+    while chunk_digits << level < d.adjusted() + 1:
+        level += 1
+    
+    def split(d, level, padded):
+        # d has at most chunk_digits * 2**level digits; padded means leading zeros are required
+        if not level:
+            digits = str(d)
+            yield digits.zfill(chunk_digits) if padded else digits
+            return
+        k = chunk_digits << (level - 1)
+        high = context.scaleb(d, -k).to_integral_value(rounding=decimal.ROUND_DOWN, context=context)
+        low = context.subtract(d, context.scaleb(high, k))
+        if padded or high:
+            yield from split(high, level - 1, padded)
+        yield from split(low, level - 1, padded or bool(high))
+    
+    yield from split(d, level, False)
+
+
+def f2_7(n: int, out=None, chunk_digits: int = 2000) -> None:
+    """
+    Prints a pattern where even digits (0,2,4,6,8) are represented by white squares ⬜
+    and odd digits (1,3,5,7,9) are represented by black squares ⬛.
+    
+    Uses the translation table of f2_5 on the digits produced chunk by chunk by
+    _digit_chunks, writing each translated chunk as soon as it is ready, so that
+    integers with millions of digits are rendered in subquadratic time and without
+    ever converting n as a whole with str(n).
+    
+    Args:
+        n: The input integer
+        out: A writable text stream (standard output by default)
+        chunk_digits: The number of digits translated and written at a time
+    """
+    import sys
+    out = sys.stdout if out is None else out
+    trans_table = str.maketrans("0123456789", "⬜⬛⬜⬛⬜⬛⬜⬛⬜⬛")
+    if n < 0:
+        out.write("-")
+    for digits in _digit_chunks(abs(n), chunk_digits):
+        out.write(digits.translate(trans_table))
+    out.write("\n")
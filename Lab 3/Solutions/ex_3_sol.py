@@ -132,3 +132,44 @@ def f3_5(n):
     # Print the results
     for base, value in conversions.items():
         print(f"{n} is {value} in base {base}")
+
+
+def bases_table(numbers):
+    """
+    Computes, for many numbers at once, what each of them reads as in every base from 2 to 10.
+    
+    The numbers are converted once to a matrix of digits, one row per number, padded
+    on the left with zeros. A vectorised Horner scheme then evaluates every row in every
+    base simultaneously, one column of digits at a time, and the bases too small for a
+    number's largest digit are masked out.
+    
+    Args:
+        numbers: A sequence or NumPy array of non-negative integers, or of strings of
+                 decimal digits, with at most 19 digits each
+    
+    Returns:
+        A masked array with one row per number and one column per base from 2 to 10;
+        entry (i, b - 2) is the value of numbers[i] read in base b, as printed by f3_1,
+        and is masked when b is not a valid base for numbers[i]
+    """
+    import numpy as np
+    
+    if isinstance(numbers, np.ndarray):
+        strings = numbers.astype(np.bytes_)
+    else:
+        # Going through str keeps integers beyond 64 bits exact (np.asarray would make them floats)
+        strings = np.array([str(number) for number in numbers], dtype=np.bytes_)
+    bases = np.arange(2, 11, dtype=np.uint64)
+    if not len(strings):
+        return np.ma.masked_array(np.zeros((0, len(bases)), dtype=np.uint64))
+    width = int(np.char.str_len(strings).max())
+    if width > 19:
+        raise ValueError('bases_table only handles numbers of at most 19 digits')
+    # Left-pad with zeros so that the last column holds the units digit of every number
+    padded = np.char.rjust(strings, width, b'0').astype(f'S{width}')
+    digits = padded.view(np.uint8).reshape(len(padded), width).astype(np.uint64) - ord('0')
+    values = np.zeros((len(padded), len(bases)), dtype=np.uint64)
+    for column in range(width):
+        values = values * bases + digits[:, column, None]
+    min_bases = np.maximum(digits.max(axis=1) + 1, 2)
+    return np.ma.masked_array(values, mask=bases < min_bases[:, None])
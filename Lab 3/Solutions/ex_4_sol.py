@@ -1,3 +1,8 @@
+import mmap
+import struct
+from collections.abc import Mapping
+
+
 def f4_1(n: int, base: int) -> dict[int, tuple[int]]:
     """
     Creates a dictionary mapping integers from 0 to n to their representation in the specified base.
@@ -132,3 +137,190 @@ def f4_4(n: int, base: int) -> dict[int, tuple[int]]:
     
     # Build dictionary using dictionary comprehension and the helper function
     return {m: convert_to_base(m) for m in range(n + 1)}
+
+
+def base_representations(n: int, base: int):
+    """
+    Lazily generates the representations in the specified base of the integers from 0 to n.
+    
+    Works like an odometer: each representation is obtained from the previous one by
+    adding 1 to its last digit in place and propagating the carry, instead of being
+    recomputed from scratch. Carries are rare (a carry past the last k digits happens
+    once every base**k numbers), so each increment takes amortised O(1) time; copying
+    the digits into the tuple yielded costs O(width) for a number of width digits.
+    
+    Args:
+        n: The upper limit of numbers to convert (inclusive)
+        base: The target base (between 2 and 9)
+    
+    Yields:
+        Tuples of digits representing 0, 1, ..., n in the specified base
+    """
+    digits = [0]
+    yield (0,)
+    for _ in range(n):
+        i = len(digits) - 1
+        # Digits equal to base - 1 roll over to 0 and carry into the digit to their left
+        while i >= 0 and digits[i] == base - 1:
+            digits[i] = 0
+            i -= 1
+        if i < 0:
+            digits.insert(0, 1)  # The number gains a digit
+        else:
+            digits[i] += 1
+        yield tuple(digits)
+
+
+def f4_5(n: int, base: int) -> dict[int, tuple[int]]:
+    """
+    Creates a dictionary mapping integers from 0 to n to their representation in the specified base.
+    
+    Uses the odometer-style generator base_representations, so no division is performed.
+    
+    Args:
+        n: The upper limit of numbers to convert (inclusive)
+        base: The target base (between 2 and 9)
+    
+    Returns:
+        A dictionary where keys are integers from 0 to n and values are tuples 
+        representing those numbers in the specified base
+    """
+    return dict(enumerate(base_representations(n, base)))
+
+
+class BaseTable(Mapping):
+    """
+    A read-only mapping from the integers from 0 to n to their representation in a given base.
+    
+    Holds the same data as the dictionaries returned by f4_1 to f4_5, but stores all digits in
+    one flat block of bytes, one row of width digits per number, padded on the left with zeroes
+    (width being the number of digits of n). An entry costs width bytes instead of the 100 or so
+    bytes of a dictionary slot, a key and a tuple. Tuples are only created when entries are read.
+    
+    The digits can be saved to a file and loaded back as a memory-mapped view of that file,
+    so that tables larger than memory can be read without loading them.
+    
+    Attributes:
+        n: The largest key
+        base: The base of the representations (between 2 and 9)
+        width: The number of digits of n in that base, which is the length of each row
+    """
+    _HEADER = struct.Struct('<4sBBQ')  # Magic, base, width, n
+    _MAGIC = b'BTAB'
+
+    def __init__(self, n: int, base: int):
+        """
+        Builds the table column by column: the digit of place value base**k cycles through
+        0, 1, ..., base - 1, each repeated base**k times, so every column is a repeated pattern.
+        No temporary is longer than a column, that is n + 1 bytes.
+        
+        Args:
+            n: The upper limit of numbers to convert (inclusive)
+            base: The target base (between 2 and 9)
+        
+        Time complexity: O(n * width), with the work done by slice assignments on bytes
+        """
+        width = 1
+        while base ** width <= n:
+            width += 1
+        digits = bytearray((n + 1) * width)
+        for k in range(width):
+            block = base ** k
+            # One period of the column, cut to n + 1 bytes for the high columns whose period is longer
+            pattern = b''.join(bytes((d,)) * min(block, max(n + 1 - d * block, 0)) for d in range(base))
+            repeats, remainder = divmod(n + 1, len(pattern))
+            digits[width - 1 - k::width] = pattern * repeats + pattern[:remainder]
+        self.n, self.base, self.width = n, base, width
+        self._digits = memoryview(digits)
+        self._mmap = None
+
+    @classmethod
+    def load(cls, path: str) -> 'BaseTable':
+        """
+        Opens a table saved with save() as a read-only memory-mapped view of the file.
+        
+        Args:
+            path: The file to load
+        
+        Returns:
+            The table, whose digits are read from the file on demand; call close() when done
+        """
+        with open(path, 'rb') as file:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, base, width, n = cls._HEADER.unpack_from(buffer)
+        if magic != cls._MAGIC or len(buffer) != cls._HEADER.size + (n + 1) * width:
+            buffer.close()
+            raise ValueError(f'{path} is not a saved BaseTable')
+        table = cls.__new__(cls)
+        table.n, table.base, table.width = n, base, width
+        table._mmap = buffer
+        table._digits = memoryview(buffer)[cls._HEADER.size:]
+        return table
+
+    def save(self, path: str) -> None:
+        """
+        Writes the table to path, as a small header followed by the rows of digits.
+        """
+        with open(path, 'wb') as file:
+            file.write(self._HEADER.pack(self._MAGIC, self.base, self.width, self.n))
+            file.write(self._digits)
+
+    def close(self) -> None:
+        """
+        Releases the memory-mapped file of a loaded table; the table can no longer be read.
+        """
+        self._digits.release()
+        if self._mmap is not None:
+            self._mmap.close()
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The number of bytes taken by the digits.
+        """
+        return self._digits.nbytes
+
+    def __getitem__(self, m: int) -> tuple[int]:
+        if not isinstance(m, int) or not 0 <= m <= self.n:
+            raise KeyError(m)
+        row = self._digits[m * self.width:(m + 1) * self.width].tobytes()
+        # Strip the padding zeroes, but keep the last digit so that 0 maps to (0,)
+        return tuple(row[:-1].lstrip(b'\0') + row[-1:])
+
+    def __iter__(self):
+        return iter(range(self.n + 1))
+
+    def __len__(self) -> int:
+        return self.n + 1
+
+
+def memory_report(n: int, base: int) -> dict[str, int]:
+    """
+    Measures how much memory the dictionary built by f4_5 and the equivalent BaseTable retain.
+    
+    Args:
+        n: The upper limit of numbers to convert (inclusive)
+        base: The target base (between 2 and 9)
+    
+    Returns:
+        The number of bytes allocated and still held after building each structure,
+        under the keys 'dict' and 'BaseTable'
+    """
+    import tracemalloc
+
+    report = {}
+    for name, build in (('dict', f4_5), ('BaseTable', BaseTable)):
+        tracemalloc.start()
+        table = build(n, base)
+        report[name] = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del table
+    return report
+
+
+if __name__ == '__main__':
+    for n in (10_000, 100_000, 1_000_000):
+        report = memory_report(n, 2)
+        print(f"n = {n:>9,} in base 2: dict {report['dict']:>12,} bytes, "
+              f"BaseTable {report['BaseTable']:>10,} bytes "
+              f"({report['dict'] / report['BaseTable']:.0f}x smaller)")
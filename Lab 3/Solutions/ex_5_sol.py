@@ -164,4 +164,86 @@ def f5_4(integral_part: int, fractional_part: int) -> None:
               f"namely, as {double_precision_str}")
     else:
         # There are rounding errors
-        print(f"{single_precision_str} prints out as {double_precision_str}")
\ No newline at end of file
+        print(f"{single_precision_str} prints out as {double_precision_str}")
+
+
+def _rounded_scaled(numerator: int, denominator: int, digits: int) -> int:
+    """
+    Returns numerator / denominator * 10**digits rounded to the nearest integer, ties to even,
+    which is the integer whose digits f'{x:.{digits}f}' prints for x = numerator / denominator.
+    """
+    quotient, remainder = divmod(numerator * 10 ** digits, denominator)
+    if 2 * remainder > denominator or 2 * remainder == denominator and quotient % 2:
+        quotient += 1
+    return quotient
+
+
+def has_trailing_zeroes(integral_part: int, fractional_part: int) -> bool:
+    """
+    Tells whether f5_1 to f5_4 report trailing zeroes for the given number, without formatting it.
+    
+    Printing a float x with q digits after the decimal point displays the exact binary value of x
+    multiplied by 10**q and rounded half to even, which is computed here with integer arithmetic
+    from x.as_integer_ratio(). With p fractional digits, there are p trailing zeroes exactly when
+    the 2p-digit rounding equals the p-digit rounding followed by p zeroes.
+    
+    Args:
+        integral_part: The integer part of the number
+        fractional_part: The fractional part (as an integer)
+    
+    Returns:
+        True if the number prints out with trailing zeroes, False if it prints out with other digits
+    
+    Time complexity: O(1) for numbers of bounded size
+    """
+    precision = len(str(fractional_part))
+    scale = 10 ** precision
+    # Integer true division is correctly rounded, so this is the same float as float(f'{i}.{f}')
+    a_float = (abs(integral_part) * scale + fractional_part) / scale
+    numerator, denominator = a_float.as_integer_ratio()
+    return (_rounded_scaled(numerator, denominator, 2 * precision)
+            == _rounded_scaled(numerator, denominator, precision) * scale)
+
+
+def _sweep_chunk(integral_parts, fractional_parts) -> bytes:
+    return bytes(map(has_trailing_zeroes, integral_parts, fractional_parts))
+
+
+def trailing_zeroes_sweep(integral_parts, fractional_parts, workers: int = 1,
+                          chunk_size: int = 1 << 16):
+    """
+    Classifies many numbers as f5_1 to f5_4 would, without printing or formatting any of them.
+    
+    Args:
+        integral_parts: A sequence of integer parts
+        fractional_parts: A sequence of fractional parts (as integers), of the same length
+        workers: The number of worker processes; with several workers, chunks of chunk_size
+            numbers are classified in a process pool, with at most twice as many chunks
+            as workers in flight
+        chunk_size: The number of numbers sent to a worker at a time
+    
+    Returns:
+        An array('B') holding, for each number in turn, 1 if it prints out with trailing zeroes
+        and 0 otherwise
+    """
+    from array import array
+
+    if len(integral_parts) != len(fractional_parts):
+        raise ValueError('integral_parts and fractional_parts must have the same length')
+    result = array('B')
+    if workers <= 1:
+        result.frombytes(_sweep_chunk(integral_parts, fractional_parts))
+        return result
+    from collections import deque
+    from concurrent.futures import ProcessPoolExecutor
+    # Only twice as many chunks as workers are sliced and in flight at a time
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for i in range(0, len(integral_parts), chunk_size):
+            pending.append(executor.submit(_sweep_chunk, integral_parts[i:i + chunk_size],
+                                           fractional_parts[i:i + chunk_size]))
+            if len(pending) >= 2 * workers:
+                result.frombytes(pending.popleft().result())
+        while pending:
+            result.frombytes(pending.popleft().result())
+    return result
@@ -137,3 +137,136 @@ def f6_4(L: list[list[int]], fields: list[int]) -> list[list[int]]:
     # Apply merge sort and return the result
     return merge_sort(result)
 
+
+def f6_5(L, fields: list[int], return_index: bool = False):
+    """
+    Sorts a table of integers based on specified fields priority.
+    
+    Uses numpy.lexsort, which sorts by its last key first and is stable, so passing the
+    columns in reverse order of fields gives the same order as f6_1, ties included.
+    Input that cannot be viewed as a 2-D integer array (rows of different lengths, or
+    integers too large for 64 bits) is sorted in pure Python as by f6_1 instead.
+    
+    Args:
+        L: A 2-D NumPy array of integers, or a list of lists of integers
+        fields: A list representing a permutation of {1, ..., n}
+        return_index: Whether to return the permutation that sorts L instead of the sorted table
+    
+    Returns:
+        If return_index is False, the sorted table: a NumPy array if L is one, otherwise
+        a new list of the inner lists of L. If return_index is True, the indices of the
+        rows of L in sorted order (a NumPy array, or a list for the pure Python path).
+    
+    Time complexity: O(len(fields) * m log m) for m rows, with the sorting done by NumPy
+    """
+    import numpy as np
+    
+    try:
+        table = np.asarray(L)
+    except ValueError:  # Ragged rows
+        table = None
+    if table is None or table.ndim != 2 or table.dtype.kind not in 'iub':
+        if return_index:
+            return sorted(range(len(L)), key=lambda k: tuple(L[k][i - 1] for i in fields))
+        return f6_1(L, fields)
+    
+    # lexsort uses its last key as the primary one
+    order = np.lexsort([table[:, i - 1] for i in reversed(fields)])
+    if return_index:
+        return order
+    if isinstance(L, np.ndarray):
+        return table[order]
+    return [L[k] for k in order]
+
+
+def _spill_run(rows: list[list[int]], row_format):
+    """
+    Writes sorted rows to an anonymous temporary file, each row packed with row_format,
+    and returns the file rewound to its start.
+    """
+    import tempfile
+    
+    file = tempfile.TemporaryFile()
+    pack = row_format.pack
+    try:
+        file.write(b''.join(pack(*row) for row in rows))
+    except Exception:
+        file.close()
+        raise
+    file.seek(0)
+    return file
+
+
+def _read_run(file, row_format, rows_per_read: int = 4096):
+    """
+    Yields the rows of a run written by _spill_run, as tuples, reading rows_per_read rows at a time.
+    """
+    while block := file.read(row_format.size * rows_per_read):
+        yield from row_format.iter_unpack(block)
+
+
+def f6_6(filename: str, fields: list[int], out=None, run_size: int = 1 << 16,
+         progress=None) -> None:
+    """
+    Sorts the rows of a CSV file of integers based on specified fields priority,
+    for files too large to be sorted in memory.
+    
+    Grows the merge sort of f6_4 into an external merge sort. The file is read in runs of
+    run_size rows, which is the memory budget: each run is sorted in memory with the key
+    of f6_1 and spilled to a temporary file, each row packed as 64-bit integers. The runs
+    are then merged with a heap, reading them back a block at a time. Both the sort of
+    a run and the merge (which prefers earlier runs on ties) are stable, so the rows are
+    written in the same order as f6_1 would return them.
+    
+    Args:
+        filename: A file with one row per line, integers separated by commas, all rows of the same length
+        fields: A list representing a permutation of {1, ..., n}
+        out: A writable text stream for the sorted rows, in the same format (standard output by default)
+        run_size: The number of rows sorted in memory at a time
+        progress: A function called as progress(stage, rows) after each run is spilled, with
+            stage 'sorting' and the number of rows read so far, and while merging, with stage
+            'merging' and the number of rows written so far
+    
+    Raises:
+        ValueError: If rows have different lengths or a value does not fit in 64 bits
+    
+    Time complexity: O(m log m) for m rows, with O(run_size) rows in memory at a time
+    """
+    import heapq
+    import struct
+    import sys
+    from itertools import islice
+    
+    out = sys.stdout if out is None else out
+    key = lambda x: tuple(x[i - 1] for i in fields)
+    runs = []
+    rows_read = 0
+    try:
+        with open(filename) as file:
+            lines = (line for line in file if line.strip())
+            row_format = None
+            while chunk := list(islice(lines, run_size)):
+                rows = [[int(value) for value in line.split(',')] for line in chunk]
+                if row_format is None:
+                    row_format = struct.Struct(f'<{len(rows[0])}q')
+                if any(len(row) * 8 != row_format.size for row in rows):
+                    raise ValueError(f'{filename}: all rows must have the same length')
+                rows.sort(key=key)
+                try:
+                    runs.append(_spill_run(rows, row_format))
+                except struct.error as error:
+                    raise ValueError(f'{filename}: {error}') from None
+                rows_read += len(rows)
+                if progress:
+                    progress('sorting', rows_read)
+        
+        rows_written = 0
+        merged = heapq.merge(*(_read_run(run, row_format) for run in runs), key=key)
+        while block := list(islice(merged, run_size)):
+            out.write(''.join(','.join(map(str, row)) + '\n' for row in block))
+            rows_written += len(block)
+            if progress:
+                progress('merging', rows_written)
+    finally:
+        for run in runs:
+            run.close()